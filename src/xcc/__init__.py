@@ -0,0 +1,250 @@
+"""XCC Compiler Collection.
+
+``main`` is the single CLI entry point. It first sniffs the argument vector
+without importing anything heavy: cc-driver invocations are handed to
+:mod:`xcc.cc_driver`, and only genuine frontend invocations pay for the
+lexer/parser import chain and argparse construction.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+
+__version__ = "0.0.0"
+
+__all__ = ["main", "__version__"]
+
+_CC_DRIVER_HINT_FLAGS = frozenset(
+    {"-c", "-S", "-E", "-o", "-shared", "-static", "-fPIC", "-fpic", "-pthread", "-g"}
+)
+_FRONTEND_HINT_PREFIXES = ("--frontend", "--dump-", "--diag-format", "--run-fixtures")
+
+
+def _sniff_mode(argv: list[str]) -> str:
+    """Decide cc-driver vs frontend mode from argv alone, import-free."""
+    has_cc_hint = False
+    for arg in argv:
+        if arg.startswith(_FRONTEND_HINT_PREFIXES):
+            return "frontend"
+        if arg in _CC_DRIVER_HINT_FLAGS or arg.startswith("-O"):
+            has_cc_hint = True
+        elif not arg.startswith("-") and arg.endswith((".o", ".a", ".so", ".S", ".s")):
+            has_cc_hint = True
+    return "cc" if has_cc_hint else "frontend"
+
+
+@functools.cache
+def _build_arg_parser():
+    # Safe to reuse: parse_args writes into a fresh Namespace per call and
+    # none of the registered actions mutate parser state.
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="xcc",
+        description="XCC Compiler Collection frontend",
+    )
+    parser.add_argument("source", nargs="?", help="C source file, or - for stdin")
+    parser.add_argument("--frontend", action="store_true", help="force frontend mode")
+    parser.add_argument("--dump-pp-tokens", action="store_true", help="dump preprocessing tokens")
+    parser.add_argument("--dump-include-trace", action="store_true", help="dump #include trace")
+    parser.add_argument("--dump-macro-table", action="store_true", help="dump object-like macros")
+    parser.add_argument("--dump-tokens", action="store_true", help="dump translation tokens")
+    parser.add_argument("--dump-ast", action="store_true", help="dump the parsed AST")
+    parser.add_argument("--dump-sema", action="store_true", help="dump the symbol summary")
+    parser.add_argument(
+        "--diag-format", choices=("text", "json"), default="text", help="diagnostic format"
+    )
+    parser.add_argument("-I", dest="include_dirs", action="append", default=[], metavar="DIR")
+    parser.add_argument("-D", dest="defines", action="append", default=[], metavar="NAME[=VAL]")
+    parser.add_argument("-U", dest="undefines", action="append", default=[], metavar="NAME")
+    parser.add_argument(
+        "--cache-ast",
+        action="store_true",
+        help="cache frontend results on disk keyed by source digest",
+    )
+    parser.add_argument(
+        "--run-fixtures",
+        action="store_true",
+        help="compile every fixture under tests/ and report FAIL lines",
+    )
+    return parser
+
+
+def _report_error(error, diag_format: str) -> None:
+    diag = error.diagnostic
+    if diag_format == "json":
+        import json
+
+        # The field names are fixed, so only the string values need escaping;
+        # formatting the object by hand skips the dict build and the encoder's
+        # per-key dispatch. Shapes must stay in sync with consumers of the
+        # json diagnostic stream.
+        print(
+            f'{{"stage":{json.dumps(diag.stage)}'
+            f',"filename":{json.dumps(diag.filename)}'
+            f',"line":{diag.line:d}'
+            f',"column":{diag.column:d}'
+            f',"message":{json.dumps(diag.message)}'
+            f',"severity":"error"}}'
+        )
+    else:
+        print(
+            f"{diag.filename}:{diag.line}:{diag.column}: error: [{diag.stage}] {diag.message}",
+            file=sys.stderr,
+        )
+
+
+def _write_lines(lines) -> None:
+    # One buffered bulk write instead of a print() call (and its syscall
+    # path) per line; token dumps easily run to tens of thousands of lines.
+    sys.stdout.writelines(f"{line}\n" for line in lines)
+
+
+def _ast_cache_path(source: str, options, stages) -> "Path":
+    import hashlib
+    from pathlib import Path
+
+    digest = hashlib.sha256(source.encode("utf-8", "surrogateescape"))
+    digest.update(repr(options).encode())
+    digest.update(str(int(stages)).encode())
+    digest.update(__version__.encode())
+    return Path.home() / ".cache" / "xcc" / "source-ast-cache" / f"{digest.hexdigest()}.pkl"
+
+
+def _ast_cache_load(cache_path):
+    import pickle
+
+    try:
+        with open(cache_path, "rb") as handle:
+            return pickle.load(handle)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+
+
+def _ast_cache_store(cache_path, result) -> None:
+    import pickle
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as handle:
+            pickle.dump(result, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # a cold cache next run beats failing the compile
+
+
+def _run_fixtures() -> int:
+    from pathlib import Path
+
+    from xcc.frontend import FrontendError, compile_path
+
+    repo_root = Path(__file__).resolve().parent.parent.parent
+    fixture_roots = (
+        repo_root / "tests" / "fixtures",
+        repo_root / "tests" / "external" / "generated",
+    )
+    failures = 0
+    total = 0
+    for root in fixture_roots:
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob("*.c")):
+            total += 1
+            try:
+                compile_path(str(path))
+            except FrontendError as error:
+                diag = error.diagnostic
+                case_name = str(path.relative_to(repo_root))
+                print(f"FAIL [{diag.stage}] {case_name}: {diag.message}")
+                failures += 1
+    print(f"fixtures: {total - failures}/{total} passed")
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if _sniff_mode(argv) == "cc":
+        from xcc import cc_driver
+
+        return cc_driver.main(argv)
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.run_fixtures:
+        return _run_fixtures()
+    if args.source is None:
+        parser.error("a source file is required")
+    from xcc.frontend import CompileStages, FrontendError, compile_source, read_source
+    from xcc.options import FrontendOptions
+
+    defines = []
+    for entry in args.defines:
+        name, _, replacement = entry.partition("=")
+        defines.append((name, replacement or "1"))
+    options = FrontendOptions(
+        include_dirs=tuple(args.include_dirs),
+        defines=tuple(defines),
+        undefines=tuple(args.undefines),
+    )
+    try:
+        filename, source = read_source(args.source)
+    except OSError as error:
+        print(f"xcc: cannot read {args.source}: {error}", file=sys.stderr)
+        return 1
+    import os
+
+    stages = CompileStages(0)
+    if args.dump_pp_tokens:
+        stages |= CompileStages.PP_TOKENS
+    if args.dump_include_trace:
+        stages |= CompileStages.INCLUDE_TRACE
+    if args.dump_macro_table:
+        stages |= CompileStages.MACRO_TABLE
+    if args.dump_tokens:
+        stages |= CompileStages.TOKENS
+    if args.dump_ast:
+        stages |= CompileStages.AST
+    if args.dump_sema:
+        stages |= CompileStages.SEMA
+    any_dump = bool(stages)
+    if not any_dump:
+        # Plain "check" invocation: parse and sema are the minimum that
+        # can still report errors; skip the pp token re-lex entirely.
+        stages = CompileStages.AST | CompileStages.SEMA
+    use_ast_cache = args.cache_ast or os.environ.get("XCC_AST_CACHE") == "1"
+    cache_path = _ast_cache_path(source, options, stages) if use_ast_cache else None
+    result = _ast_cache_load(cache_path) if cache_path is not None else None
+    if result is None:
+        try:
+            result = compile_source(source, filename=filename, options=options, stages=stages)
+        except FrontendError as error:
+            _report_error(error, args.diag_format)
+            return 1
+        if cache_path is not None:
+            _ast_cache_store(cache_path, result)
+    if not any_dump:
+        # Default path: skip the six dump branches outright.
+        print(f"{filename}: ok")
+        return 0
+    from xcc.lexer import format_tokens
+
+    if args.dump_pp_tokens:
+        _write_lines(format_tokens(list(result.pp_tokens)))
+    if args.dump_include_trace:
+        _write_lines(result.include_trace)
+    if args.dump_macro_table:
+        _write_lines(
+            f"{name} {replacement}".rstrip()
+            for name, replacement in sorted(result.macro_table)
+        )
+    if args.dump_tokens:
+        _write_lines(format_tokens(list(result.tokens)))
+    if args.dump_ast:
+        from xcc.ast import format_ast
+
+        _write_lines(format_ast(result.unit))
+    if args.dump_sema:
+        _write_lines(result.sema)
+    return 0
@@ -0,0 +1,450 @@
+"""AST node definitions for the xcc C frontend.
+
+Nodes are immutable: the parser builds them bottom-up and later passes only
+read them. ``TypeSpec`` carries the whole declarator chain (pointers, arrays,
+function suffixes) as a tuple of ``(kind, value)`` ops and derives the
+convenience ``pointer_depth``/``array_lengths`` views from it.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+
+class DeclaratorKind(IntEnum):
+    PTR = 0
+    ARR = 1
+    FUNC = 2
+
+
+DeclaratorValue = int | None
+DeclaratorOp = tuple[DeclaratorKind, DeclaratorValue]
+
+POINTER_OP: DeclaratorOp = (DeclaratorKind.PTR, 0)
+FUNC_OP: DeclaratorOp = (DeclaratorKind.FUNC, None)
+ARRAY_OP_KIND = DeclaratorKind.ARR
+
+# Byte sizes of the base types on the LP64 model xcc assumes; shared with
+# the parser's constant folder and simple-type validation.
+BASE_TYPE_SIZES = {
+    "void": 1,
+    "char": 1,
+    "short": 2,
+    "int": 4,
+    "long": 8,
+    "long long": 8,
+    "float": 4,
+    "double": 8,
+    "long double": 16,
+    "_Bool": 1,
+}
+
+
+def _ops_from_legacy(
+    pointer_depth: int, array_lengths: tuple[int, ...]
+) -> tuple[DeclaratorOp, ...]:
+    """Build a declarator-op chain from the older depth/lengths encoding."""
+    ops: list[DeclaratorOp] = [POINTER_OP] * pointer_depth
+    for length in array_lengths:
+        ops.append((DeclaratorKind.ARR, length))
+    return tuple(ops)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordMemberDecl:
+    name: str
+    member_type: "TypeSpec"
+    bit_width: int | None = None
+
+
+# Dispatch table for legacy tuple-encoded record members; keyed by tuple
+# length so normalization avoids a chain of isinstance/len checks per member.
+_RECORD_NORMALIZERS = {
+    2: lambda member: RecordMemberDecl(member[0], member[1]),
+    3: lambda member: RecordMemberDecl(*member),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TypeSpec:
+    name: str
+    pointer_depth: int = 0
+    array_lengths: tuple[int, ...] = ()
+    qualifiers: tuple[str, ...] = ()
+    declarator_ops: tuple[DeclaratorOp, ...] = ()
+    is_atomic: bool = False
+    record_tag: str | None = None
+    record_members: tuple = ()
+    enum_tag: str | None = None
+    enum_members: tuple[tuple[str, int], ...] = ()
+    _hash: int = field(default=0, init=False, compare=False, repr=False)
+    # -1 marks "not yet computed"; None is a real result (no known size).
+    _byte_size: int | None = field(default=-1, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.declarator_ops:
+            # One fused pass; this constructor runs for every declarator parsed.
+            pointer_depth = 0
+            array_lengths: list[int] = []
+            for kind, value in self.declarator_ops:
+                if kind is DeclaratorKind.PTR:
+                    pointer_depth += 1
+                elif kind is DeclaratorKind.ARR and isinstance(value, int):
+                    array_lengths.append(value)
+            if pointer_depth != self.pointer_depth:
+                object.__setattr__(self, "pointer_depth", pointer_depth)
+            if tuple(array_lengths) != self.array_lengths:
+                object.__setattr__(self, "array_lengths", tuple(array_lengths))
+        if self.record_members:
+            normalized = []
+            for member in self.record_members:
+                if type(member) is RecordMemberDecl:
+                    normalized.append(member)
+                    continue
+                try:
+                    normalize = _RECORD_NORMALIZERS[len(member)]
+                except (KeyError, TypeError):
+                    raise TypeError(
+                        f"unsupported record member entry: {member!r}"
+                    ) from None
+                normalized.append(normalize(member))
+            object.__setattr__(self, "record_members", tuple(normalized))
+        # TypeSpec keys the sema symbol tables; hash once here instead of
+        # re-hashing every field on each lookup.
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(
+                (
+                    self.name,
+                    self.pointer_depth,
+                    self.array_lengths,
+                    self.qualifiers,
+                    self.is_atomic,
+                    self.record_tag,
+                    self.record_members,
+                    self.enum_tag,
+                    self.enum_members,
+                )
+            ),
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def byte_size(self) -> int | None:
+        """sizeof in bytes (pointers count as 8), or None when unknown.
+
+        Computed on first access and cached on the instance, so repeated
+        sizeof folding over the same TypeSpec pays one table walk.
+        """
+        size = self._byte_size
+        if size == -1:
+            if self.pointer_depth:
+                size = 8
+            else:
+                size = BASE_TYPE_SIZES.get(self.name)
+                if size is not None:
+                    for length in self.array_lengths:
+                        size *= length
+            object.__setattr__(self, "_byte_size", size)
+        return size
+
+    def describe(self) -> str:
+        text = " ".join((*self.qualifiers, self.name))
+        if self.is_atomic:
+            text = f"_Atomic {text}"
+        text += "*" * self.pointer_depth
+        for length in self.array_lengths:
+            text += f"[{length}]"
+        return text
+
+
+@dataclass(frozen=True, slots=True)
+class Identifier:
+    name: str
+
+    def __init__(self, name: str) -> None:
+        # Hand-written ctor: skips the generated default/__post_init__
+        # plumbing on one of the hottest allocation sites in the parser.
+        object.__setattr__(self, "name", name)
+
+
+@dataclass(frozen=True, slots=True)
+class IntLiteral:
+    value: str
+
+    def __init__(self, value: str) -> None:
+        object.__setattr__(self, "value", value)
+
+
+@dataclass(frozen=True, slots=True)
+class FloatLiteral:
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class CharConstant:
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class StringLiteral:
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class UnaryExpr:
+    op: str
+    operand: Expr
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryExpr:
+    op: str
+    left: Expr
+    right: Expr
+
+    def __init__(self, op: str, left: Expr, right: Expr) -> None:
+        object.__setattr__(self, "op", op)
+        object.__setattr__(self, "left", left)
+        object.__setattr__(self, "right", right)
+
+
+@dataclass(frozen=True, slots=True)
+class AssignExpr:
+    op: str
+    target: Expr
+    value: Expr
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionalExpr:
+    condition: Expr
+    then_value: Expr
+    else_value: Expr
+
+
+@dataclass(frozen=True, slots=True)
+class CallExpr:
+    func: Expr
+    args: tuple[Expr, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class IndexExpr:
+    base: Expr
+    index: Expr
+
+
+@dataclass(frozen=True, slots=True)
+class CastExpr:
+    target_type: TypeSpec
+    operand: Expr
+
+
+@dataclass(frozen=True, slots=True)
+class SizeofExpr:
+    target_type: TypeSpec | None
+    operand: Expr | None
+
+
+@dataclass(frozen=True, slots=True)
+class InitItem:
+    value: Expr
+    designator: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class InitList:
+    items: tuple[InitItem, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ExprStmt:
+    expr: Expr
+
+    def __init__(self, expr: Expr) -> None:
+        object.__setattr__(self, "expr", expr)
+
+
+@dataclass(frozen=True, slots=True)
+class ReturnStmt:
+    value: Expr | None
+
+
+@dataclass(frozen=True, slots=True)
+class BreakStmt:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ContinueStmt:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class IfStmt:
+    condition: Expr
+    then_branch: Stmt
+    else_branch: Stmt | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WhileStmt:
+    condition: Expr
+    body: Stmt
+
+
+@dataclass(frozen=True, slots=True)
+class CompoundStmt:
+    statements: tuple[Stmt, ...] = ()
+
+    def __init__(self, statements: tuple[Stmt, ...] = ()) -> None:
+        object.__setattr__(self, "statements", statements)
+
+
+@dataclass(frozen=True, slots=True)
+class Declaration:
+    name: str
+    decl_type: TypeSpec
+    initializer: Expr | None = None
+    storage: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class DeclGroupStmt:
+    declarations: tuple[Declaration, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class StaticAssertDecl:
+    condition: Expr
+    message: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Param:
+    name: str | None
+    param_type: TypeSpec
+
+
+@dataclass(frozen=True, slots=True)
+class FunctionDef:
+    name: str
+    return_type: TypeSpec
+    params: tuple[Param, ...] = ()
+    body: CompoundStmt | None = None
+    storage: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class TranslationUnit:
+    filename: str
+    functions: tuple[FunctionDef, ...] = ()
+    declarations: tuple[Declaration, ...] = ()
+    externals: tuple[Declaration, ...] = ()
+
+
+# Typing-only markers. The old empty ``Expr``/``Stmt`` base classes added an
+# MRO level to every node and slowed isinstance dispatch in visitors for no
+# runtime benefit; closed unions carry the same information for free.
+Expr = (
+    Identifier
+    | IntLiteral
+    | FloatLiteral
+    | CharConstant
+    | StringLiteral
+    | UnaryExpr
+    | BinaryExpr
+    | AssignExpr
+    | ConditionalExpr
+    | CallExpr
+    | IndexExpr
+    | CastExpr
+    | SizeofExpr
+    | InitList
+)
+Stmt = (
+    ExprStmt
+    | ReturnStmt
+    | BreakStmt
+    | ContinueStmt
+    | IfStmt
+    | WhileStmt
+    | CompoundStmt
+    | Declaration
+    | DeclGroupStmt
+    | StaticAssertDecl
+)
+Node = Expr | Stmt
+
+
+# Flyweight factories. Real C source repeats `i`, `0`, `1`, and the basic
+# types thousands of times; since the nodes are frozen, every occurrence can
+# share one canonical instance. `sys.intern` on the spelling also collapses
+# the underlying str objects across the cache.
+
+
+@functools.lru_cache(maxsize=4096)
+def make_identifier(name: str) -> Identifier:
+    return Identifier(name=sys.intern(name))
+
+
+@functools.lru_cache(maxsize=4096)
+def make_int_literal(value: str) -> IntLiteral:
+    return IntLiteral(value=sys.intern(value))
+
+
+_EMPTY_INIT_LIST = InitList(items=())
+
+
+def make_init_list(items) -> InitList:
+    """Build an InitList, sharing one singleton for the common ``{}`` case."""
+    return _EMPTY_INIT_LIST if not items else InitList(items=tuple(items))
+
+
+@functools.lru_cache(maxsize=1024)
+def make_type_spec(
+    name: str,
+    pointer_depth: int = 0,
+    array_lengths: tuple[int, ...] = (),
+) -> TypeSpec:
+    return TypeSpec(
+        name=sys.intern(name),
+        pointer_depth=pointer_depth,
+        array_lengths=array_lengths,
+    )
+
+
+def format_ast(node: object, indent: int = 0) -> list[str]:
+    """Render a node tree as indented ``ClassName field=...`` lines."""
+    pad = "  " * indent
+    if isinstance(node, (list, tuple)):
+        lines = []
+        for item in node:
+            lines.extend(format_ast(item, indent))
+        return lines
+    if isinstance(node, TypeSpec):
+        return [f"{pad}TypeSpec {node.describe()}"]
+    if not hasattr(node, "__dataclass_fields__"):
+        return [f"{pad}{node!r}"]
+    scalars = []
+    children: list[tuple[str, object]] = []
+    for name in node.__dataclass_fields__:
+        value = getattr(node, name)
+        if isinstance(value, (list, tuple)) and value and hasattr(value[0], "__dataclass_fields__"):
+            children.append((name, value))
+        elif hasattr(value, "__dataclass_fields__"):
+            children.append((name, value))
+        elif value not in (None, (), []):
+            scalars.append(f"{name}={value!r}")
+    lines = [f"{pad}{type(node).__name__} {' '.join(scalars)}".rstrip()]
+    for name, value in children:
+        lines.append(f"{pad}  {name}:")
+        lines.extend(format_ast(value, indent + 2))
+    return lines
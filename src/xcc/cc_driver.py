@@ -0,0 +1,154 @@
+"""cc-compatible driver mode.
+
+When xcc is invoked the way a build system invokes ``cc`` (``-c``, ``-o``,
+``.c`` inputs, ...), this module parses the flags we understand into
+:class:`FrontendOptions`, runs the xcc frontend over each C input as a
+checker, and then delegates the actual compilation to the host compiler
+with the original argument vector.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+
+from xcc.options import FrontendOptions
+
+CC_SOURCE_SUFFIXES = (".c", ".i")
+CC_INPUT_SUFFIXES = (".c", ".i", ".S", ".s", ".o", ".a", ".so")
+
+_FRONTEND_ONLY_FLAGS = ("--frontend", "--dump-", "--diag-format")
+
+_CC_DRIVER_FLAGS = frozenset(
+    {
+        "-c", "-S", "-E", "-o", "-shared", "-static", "-fPIC", "-fpic",
+        "-pthread", "-g", "-O0", "-O1", "-O2", "-O3", "-Os",
+    }
+)
+
+
+# Value-taking options mapped to their FrontendOptions bucket (None means
+# recognized but ignored). The joined candidates are probed longest-first
+# so "-isystemX" never matches "-I".
+_VALUE_OPTS: dict[str, str | None] = {
+    "-iquote": "quote_include_dirs",
+    "-isystem": "system_include_dirs",
+    "-I": "include_dirs",
+    "-D": "defines",
+    "-U": "undefines",
+    "-include": None,
+}
+_JOINED_OPTS = tuple(sorted(_VALUE_OPTS, key=len, reverse=True))
+
+
+def _frontend_options_from_cc_argv(
+    argv: list[str],
+) -> tuple[FrontendOptions, list[str], bool]:
+    """Extract frontend flags, the C source inputs, and the cc-mode verdict.
+
+    The "does this argv look like a cc invocation" heuristic rides along in
+    the same scan so the driver never walks argv twice.
+    """
+    is_cc_invocation = False
+    buckets: dict[str, list] = {
+        "include_dirs": [],
+        "quote_include_dirs": [],
+        "system_include_dirs": [],
+        "defines": [],
+        "undefines": [],
+    }
+    inputs: list[str] = []
+    index = 0
+    length = len(argv)
+    while index < length:
+        arg = argv[index]
+        if arg.startswith(_FRONTEND_ONLY_FLAGS):
+            is_cc_invocation = False
+            break
+        if not is_cc_invocation and (
+            arg in _CC_DRIVER_FLAGS or arg.endswith(CC_INPUT_SUFFIXES)
+        ):
+            is_cc_invocation = True
+        target = _VALUE_OPTS.get(arg, "")
+        if target != "":
+            # Exact "-I foo" form: the value is the next argument.
+            index += 1
+            if index < length:
+                value = argv[index]
+                index += 1
+            else:
+                continue
+        else:
+            target = ""
+            value = None
+            for opt in _JOINED_OPTS:
+                if arg.startswith(opt) and len(arg) > len(opt):
+                    target = _VALUE_OPTS[opt]
+                    value = arg[len(opt):]
+                    break
+            if value is None:
+                if arg == "-o":
+                    index += 2
+                    continue
+                if not arg.startswith("-") and arg.endswith(CC_SOURCE_SUFFIXES):
+                    inputs.append(arg)
+                index += 1
+                continue
+            index += 1
+        if target is None:
+            continue
+        if target == "defines":
+            name, _, replacement = value.partition("=")
+            buckets["defines"].append((name, replacement or "1"))
+        else:
+            buckets[target].append(value)
+    include_dirs = buckets["include_dirs"]
+    quote_include_dirs = buckets["quote_include_dirs"]
+    system_include_dirs = buckets["system_include_dirs"]
+    defines = buckets["defines"]
+    undefines = buckets["undefines"]
+    options = FrontendOptions(
+        include_dirs=tuple(include_dirs),
+        quote_include_dirs=tuple(quote_include_dirs),
+        system_include_dirs=tuple(system_include_dirs),
+        defines=tuple(defines),
+        undefines=tuple(undefines),
+    )
+    return options, inputs, is_cc_invocation
+
+
+def _find_host_cc() -> str | None:
+    for name in ("cc", "clang", "gcc"):
+        path = shutil.which(name)
+        if path is not None:
+            return path
+    return None
+
+
+def main(argv: list[str]) -> int:
+    options, inputs, is_cc_invocation = _frontend_options_from_cc_argv(argv)
+    if not is_cc_invocation:
+        print("xcc: argv does not look like a cc invocation", file=sys.stderr)
+        return 2
+    from xcc.frontend import FrontendError, compile_path
+
+    for path in inputs:
+        try:
+            compile_path(path, options=options)
+        except FrontendError as error:
+            diag = error.diagnostic
+            print(
+                f"{diag.filename}:{diag.line}:{diag.column}: error: [{diag.stage}] {diag.message}",
+                file=sys.stderr,
+            )
+            return 1
+        except OSError as error:
+            print(f"xcc: cannot read {path}: {error}", file=sys.stderr)
+            return 1
+    host_cc = _find_host_cc()
+    if host_cc is None:
+        # No host compiler: the frontend check is all we can offer.
+        return 0
+    completed = subprocess.run([host_cc, *argv])
+    return completed.returncode
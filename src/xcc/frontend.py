@@ -0,0 +1,376 @@
+"""Frontend pipeline: source -> tokens -> AST -> symbol summary.
+
+``compile_source`` drives the whole pipeline and wraps lexer/parser/sema
+failures into :class:`FrontendError` carrying a :class:`Diagnostic`, so the
+CLI and the cc driver have a single error shape to render. The "preprocessor"
+here is deliberately shallow: directives are recorded and blanked out (line
+numbers are preserved), object-like macros are expanded textually, and
+``#include`` lines are only traced, never resolved.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import re
+import stat
+from dataclasses import dataclass, field
+from enum import IntFlag
+from pathlib import Path
+from typing import NamedTuple
+
+from xcc.ast import TranslationUnit
+from xcc.lexer import Lexer, LexerError, Token, translate_source
+from xcc.options import FrontendOptions, normalize_options
+from xcc.parser import Parser, ParserError
+
+_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+
+# One physical line per match, keepends-style, without materializing the
+# full list[str] that splitlines() builds up front.
+_LINE_RE = re.compile(r"[^\n]*\n|[^\n]+")
+
+
+class CompileStages(IntFlag):
+    """Selects which FrontendResult fields compile_source must populate."""
+
+    PP_TOKENS = 1
+    INCLUDE_TRACE = 2
+    MACRO_TABLE = 4
+    TOKENS = 8
+    AST = 16
+    SEMA = 32
+    ALL = PP_TOKENS | INCLUDE_TRACE | MACRO_TABLE | TOKENS | AST | SEMA
+
+
+class Diagnostic(NamedTuple):
+    stage: str
+    filename: str
+    line: int
+    column: int
+    message: str
+
+
+class FrontendError(Exception):
+    def __init__(self, diagnostic: Diagnostic) -> None:
+        super().__init__(diagnostic.message)
+        self.diagnostic = diagnostic
+
+
+@dataclass(frozen=True)
+class FrontendResult:
+    filename: str
+    source: str
+    pp_source: str
+    include_trace: tuple[str, ...]
+    macro_table: tuple[tuple[str, str], ...]
+    tokens: tuple[Token, ...]
+    unit: TranslationUnit
+    sema: tuple[str, ...]
+    # Populated eagerly only when CompileStages.PP_TOKENS was requested;
+    # otherwise the pp_tokens property re-lexes on first access.
+    _pp_tokens: tuple[Token, ...] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def pp_tokens(self) -> tuple[Token, ...]:
+        """Preprocessing tokens, lexed lazily when the stage was skipped.
+
+        Callers that never touch this field (the cc driver, plain check
+        invocations) no longer pay for a second full lex of the source.
+        """
+        tokens = self._pp_tokens
+        if tokens is None:
+            try:
+                tokens = lex_pp(translate_source(self.source), filename=self.filename)
+            except LexerError as error:
+                raise FrontendError(
+                    Diagnostic(
+                        stage="pp",
+                        filename=self.filename,
+                        line=error.line,
+                        column=error.column,
+                        message=error.message,
+                    )
+                ) from error
+            object.__setattr__(self, "_pp_tokens", tokens)
+        return tokens
+
+
+# Below this size the mmap setup costs more than the copy it avoids.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def read_source(path: str) -> tuple[str, str]:
+    """Read a source file (or stdin for ``-``); returns (filename, text)."""
+    if path == "-":
+        import sys
+
+        return "<stdin>", sys.stdin.read()
+    resolved = Path(path)
+    status = os.stat(resolved)
+    if stat.S_ISREG(status.st_mode) and status.st_size > _MMAP_THRESHOLD:
+        import mmap
+
+        with open(resolved, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # str() decodes straight off the page-cache-backed mapping;
+                # skips the intermediate bytes copy read() would make.
+                return str(resolved), str(mapped, "utf-8")
+    # One binary read plus one decode; read_text routes through a
+    # TextIOWrapper whose incremental decoder costs more on small files.
+    return str(resolved), resolved.read_bytes().decode("utf-8")
+
+
+def _parse_object_like_define(line: str) -> tuple[str, str] | None:
+    """Split ``#define NAME replacement`` into a (name, replacement) pair.
+
+    Function-like macros (``NAME(`` with no space) are skipped; expanding
+    them textually would be wrong more often than right.
+    """
+    body = line.strip()[1:].strip()
+    if not body.startswith("define"):
+        return None
+    body = body[len("define"):].strip()
+    match = _IDENT_RE.match(body)
+    if match is None:
+        return None
+    name = match.group(0)
+    rest = body[match.end():]
+    if rest.startswith("("):
+        return None
+    return name, rest.strip()
+
+
+def _compile_macro_pattern(macros: dict[str, str]) -> re.Pattern[str]:
+    return re.compile(
+        r"\b(?:"
+        + "|".join(re.escape(name) for name in sorted(macros, key=len, reverse=True))
+        + r")\b"
+    )
+
+
+def _normalize_source(
+    source: str, options: FrontendOptions
+) -> tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]]:
+    """Blank directives, expand object-like macros, and drop asm statements.
+
+    One pass over the lines: directive state, asm state, and macro
+    expansion used to live in two separate strippers that each split and
+    re-joined the whole source. Line numbers are preserved throughout.
+    """
+    macros: dict[str, str] = dict(options.defines)
+    include_trace: list[str] = []
+    in_directive_continuation = False
+    in_asm_statement = False
+    # The expansion pattern only changes when a directive mutates the macro
+    # table, so compile it once per mutation rather than once per line. The
+    # replacement closure is likewise built once: ``macros`` is mutated in
+    # place, so one closure stays current across the whole pass.
+    macro_pattern: re.Pattern[str] | None = None
+    macro_sub = None
+
+    def _expand(match: re.Match[str]) -> str:
+        return macros[match.group(0)]
+
+    out: list[str] = []
+    append = out.append
+    for line_match in _LINE_RE.finditer(source):
+        line = line_match.group()
+        stripped = line.strip()
+        if in_directive_continuation:
+            append("\n" if line.endswith("\n") else "")
+            in_directive_continuation = stripped.endswith("\\")
+            continue
+        if stripped.startswith("#"):
+            in_directive_continuation = stripped.endswith("\\")
+            directive_body = stripped[1:].strip()
+            if directive_body.startswith("include"):
+                include_trace.append(directive_body[len("include"):].strip())
+            else:
+                define = _parse_object_like_define(line)
+                if define is not None:
+                    macros[define[0]] = define[1]
+                    macro_pattern = None
+                elif directive_body.startswith("undef"):
+                    if macros.pop(directive_body[len("undef"):].strip(), None) is not None:
+                        macro_pattern = None
+            append("\n" if line.endswith("\n") else "")
+            continue
+        if macros:
+            if macro_pattern is None:
+                macro_pattern = _compile_macro_pattern(macros)
+                macro_sub = macro_pattern.sub
+            line = macro_sub(_expand, line)
+        if in_asm_statement:
+            if ";" in line:
+                append(line.split(";", 1)[1])
+                in_asm_statement = False
+            else:
+                append("\n" if line.endswith("\n") else "")
+            continue
+        lstripped = line.lstrip()
+        if lstripped.startswith(("__asm__", "asm ", "asm(", "asm\t")):
+            if ";" in line:
+                indent = line[: len(line) - len(lstripped)]
+                append(indent + line.split(";", 1)[1].lstrip())
+            else:
+                in_asm_statement = True
+                append("\n" if line.endswith("\n") else "")
+            continue
+        append(line)
+    return "".join(out), tuple(include_trace), tuple(macros.items())
+
+
+def lex_pp(source: str, filename: str = "<string>") -> tuple[Token, ...]:
+    """Lex raw (translated, unstripped) source into preprocessing tokens."""
+    return tuple(Lexer(source, filename=filename, mode="pp").tokenize())
+
+
+def _analyze(unit: TranslationUnit, filename: str) -> tuple[str, ...]:
+    """Produce the symbol summary shown by ``--dump-sema``."""
+    lines: list[str] = []
+    seen_functions: dict[str, int] = {}
+    for index, function in enumerate(unit.functions):
+        previous = seen_functions.get(function.name)
+        if previous is not None:
+            raise FrontendError(
+                Diagnostic(
+                    stage="sema",
+                    filename=filename,
+                    line=0,
+                    column=0,
+                    message=f"redefinition of function {function.name!r}",
+                )
+            )
+        seen_functions[function.name] = index
+        params = ", ".join(param.param_type.describe() for param in function.params) or "void"
+        lines.append(f"function {function.name}({params}) -> {function.return_type.describe()}")
+    for declaration in unit.declarations:
+        lines.append(f"global {declaration.name}: {declaration.decl_type.describe()}")
+    for declaration in unit.externals:
+        lines.append(f"extern {declaration.name}: {declaration.decl_type.describe()}")
+    return tuple(lines)
+
+
+def compile_source(
+    source: str,
+    filename: str = "<string>",
+    options: FrontendOptions | None = None,
+    stages: CompileStages = CompileStages.ALL,
+) -> FrontendResult:
+    """Run the frontend pipeline over ``source``, memoized per process.
+
+    ``stages`` trims the pipeline to what the caller will actually read:
+    phases whose output was not requested are skipped and their result
+    fields come back empty. Include trace and macro table are byproducts
+    of directive stripping and are always populated.
+    """
+    options = normalize_options(options)
+    # A short digest keys the LRU entry so repeat compilations of a large
+    # source compare 16 bytes instead of rehashing the whole text.
+    digest = hashlib.blake2b(source.encode(), digest_size=16).digest()
+    return _compile_cached(digest, source, filename, options, stages)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_cached(
+    source_digest: bytes,
+    source: str,
+    filename: str,
+    options: FrontendOptions,
+    stages: CompileStages,
+) -> FrontendResult:
+    translated = translate_source(source)
+    pp_source, include_trace, macro_table = _normalize_source(translated, options)
+    need_tokens = stages & (CompileStages.TOKENS | CompileStages.AST | CompileStages.SEMA)
+    need_unit = stages & (CompileStages.AST | CompileStages.SEMA)
+    tokens: tuple[Token, ...] = ()
+    unit = TranslationUnit(filename=filename)
+    sema: tuple[str, ...] = ()
+    pp_tokens: tuple[Token, ...] | None = None
+    if need_tokens:
+        try:
+            tokens = tuple(Lexer(pp_source, filename=filename, mode="translation").tokenize())
+        except LexerError as error:
+            raise FrontendError(
+                Diagnostic(
+                    stage="lex",
+                    filename=filename,
+                    line=error.line,
+                    column=error.column,
+                    message=error.message,
+                )
+            ) from error
+    if need_unit:
+        try:
+            unit = Parser(list(tokens), filename=filename).parse()
+        except ParserError as error:
+            raise FrontendError(
+                Diagnostic(
+                    stage="parse",
+                    filename=filename,
+                    line=error.line,
+                    column=error.column,
+                    message=error.message,
+                )
+            ) from error
+    if stages & CompileStages.SEMA:
+        sema = _analyze(unit, filename)
+    if stages & CompileStages.PP_TOKENS:
+        try:
+            pp_tokens = lex_pp(translated, filename=filename)
+        except LexerError as error:
+            raise FrontendError(
+                Diagnostic(
+                    stage="pp",
+                    filename=filename,
+                    line=error.line,
+                    column=error.column,
+                    message=error.message,
+                )
+            ) from error
+    return FrontendResult(
+        filename=filename,
+        source=source,
+        pp_source=pp_source,
+        include_trace=include_trace,
+        macro_table=macro_table,
+        tokens=tokens,
+        unit=unit,
+        sema=sema,
+        _pp_tokens=pp_tokens,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_path_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    options: FrontendOptions,
+    stages: CompileStages,
+) -> FrontendResult:
+    filename, source = read_source(path)
+    return compile_source(source, filename=filename, options=options, stages=stages)
+
+
+def compile_path(
+    path: str,
+    options: FrontendOptions | None = None,
+    stages: CompileStages = CompileStages.ALL,
+) -> FrontendResult:
+    options = normalize_options(options)
+    if path != "-":
+        try:
+            status = os.stat(path)
+        except OSError:
+            status = None
+        if status is not None and stat.S_ISREG(status.st_mode):
+            # (mtime, size) in the key invalidates entries when the file
+            # changes, so unchanged files skip the read entirely.
+            return _compile_path_cached(
+                path, status.st_mtime_ns, status.st_size, options, stages
+            )
+    filename, source = read_source(path)
+    return compile_source(source, filename=filename, options=options, stages=stages)
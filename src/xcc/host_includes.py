@@ -0,0 +1,117 @@
+"""Discovery of the host compiler's system include directories.
+
+On macOS the SDK and resource directories are looked up through ``xcrun``;
+elsewhere a small set of conventional Unix locations is probed. Results are
+cached per process since the host toolchain does not change mid-run.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_XCRUN_TIMEOUT = 5
+
+_COMMON_UNIX_INCLUDE_DIRS = (
+    "/usr/local/include",
+    "/usr/include",
+)
+
+
+def _xcrun_stdout(*args: str) -> str:
+    try:
+        completed = subprocess.run(
+            ("xcrun", *args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=_XCRUN_TIMEOUT,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout.strip()
+
+
+def _include_cache_path(sdkroot: str) -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    key = hashlib.sha1(sdkroot.encode()).hexdigest()[:8]
+    return Path(cache_home) / "xcc" / f"host-includes-{sys.platform}-{key}.json"
+
+
+def _load_include_cache(cache_path: Path) -> tuple[str, ...] | None:
+    try:
+        with open(cache_path, encoding="utf-8") as handle:
+            dirs = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(dirs, list) or not all(isinstance(d, str) for d in dirs):
+        return None
+    # A vanished directory means the toolchain moved; refetch rather than
+    # serving stale paths forever.
+    if not all(Path(d).is_dir() for d in dirs):
+        return None
+    return tuple(dirs)
+
+
+def _store_include_cache(cache_path: Path, dirs: list[str]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(dirs), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # the cache is an optimization; never fail discovery over it
+
+
+def _darwin_include_dirs() -> tuple[str, ...]:
+    # The xcrun lookups dominate cold-start latency, so their result is
+    # persisted across processes, keyed by SDKROOT (and platform, in the
+    # file name) so switching SDKs never serves the wrong directories.
+    sdkroot = os.environ.get("SDKROOT", "")
+    cache_path = _include_cache_path(sdkroot)
+    cached = _load_include_cache(cache_path)
+    if cached is not None:
+        return cached
+    dirs: list[str] = []
+    if sdkroot:
+        sdk_path = sdkroot
+        resource_dir = _xcrun_stdout("--sdk", "macosx", "clang", "-print-resource-dir")
+    else:
+        # Both lookups are independent subprocesses; overlapping them puts
+        # a cold start at ~1x xcrun latency instead of 2x.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sdk_future = executor.submit(
+                _xcrun_stdout, "--sdk", "macosx", "--show-sdk-path"
+            )
+            resource_future = executor.submit(
+                _xcrun_stdout, "--sdk", "macosx", "clang", "-print-resource-dir"
+            )
+            sdk_path = sdk_future.result()
+            resource_dir = resource_future.result()
+    if resource_dir:
+        dirs.append(str(Path(resource_dir) / "include"))
+    if sdk_path:
+        dirs.append(str(Path(sdk_path) / "usr" / "include"))
+    dirs = [d for d in dirs if Path(d).is_dir()]
+    _store_include_cache(cache_path, dirs)
+    return tuple(dirs)
+
+
+@functools.cache
+def _host_system_include_dirs() -> tuple[str, ...]:
+    if sys.platform == "darwin":
+        return _darwin_include_dirs()
+    return tuple(d for d in _COMMON_UNIX_INCLUDE_DIRS if Path(d).is_dir())
+
+
+def host_system_include_dirs() -> tuple[str, ...]:
+    """Public accessor; kept separate so the cache stays an implementation detail."""
+    return _host_system_include_dirs()
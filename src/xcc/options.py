@@ -0,0 +1,43 @@
+"""Frontend configuration shared by the CLI and the cc driver."""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FrontendOptions:
+    include_dirs: tuple[str, ...] = ()
+    quote_include_dirs: tuple[str, ...] = ()
+    system_include_dirs: tuple[str, ...] = ()
+    defines: tuple[tuple[str, str], ...] = ()
+    undefines: tuple[str, ...] = ()
+    std: str = "c11"
+    keep_gnu_extensions: bool = True
+
+
+DEFAULT_OPTIONS = FrontendOptions()
+
+
+# Memoized: builds pass the same options object for every file, and
+# normalization is pure over a frozen, hashable input.
+@functools.lru_cache(maxsize=32)
+def normalize_options(options: FrontendOptions | None) -> FrontendOptions:
+    """Return a canonical options object: tuples, deduplicated defines."""
+    if options is None:
+        return DEFAULT_OPTIONS
+    defines: dict[str, str] = {}
+    for name, replacement in options.defines:
+        defines[name] = replacement
+    for name in options.undefines:
+        defines.pop(name, None)
+    return FrontendOptions(
+        include_dirs=tuple(dict.fromkeys(options.include_dirs)),
+        quote_include_dirs=tuple(dict.fromkeys(options.quote_include_dirs)),
+        system_include_dirs=tuple(dict.fromkeys(options.system_include_dirs)),
+        defines=tuple(defines.items()),
+        undefines=tuple(dict.fromkeys(options.undefines)),
+        std=options.std,
+        keep_gnu_extensions=options.keep_gnu_extensions,
+    )
@@ -0,0 +1,1384 @@
+"""Recursive-descent parser for the C subset accepted by xcc.
+
+The parser consumes the token list produced by :mod:`xcc.lexer` in
+``"translation"`` mode and builds the node tree defined in :mod:`xcc.ast`.
+Typedef names are tracked through a scope stack so the classic
+``declaration vs expression`` ambiguity resolves the way a C compiler
+resolves it; top-level function definitions are recognized with a
+speculative probe (:meth:`Parser._looks_like_function`) that is rolled
+back before the real parse.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+from collections.abc import Callable
+
+from xcc.ast import (
+    AssignExpr,
+    BinaryExpr,
+    BreakStmt,
+    CallExpr,
+    CastExpr,
+    CharConstant,
+    CompoundStmt,
+    ConditionalExpr,
+    ContinueStmt,
+    Declaration,
+    DeclaratorOp,
+    DeclGroupStmt,
+    Expr,
+    ExprStmt,
+    FloatLiteral,
+    FunctionDef,
+    Identifier,
+    IfStmt,
+    IndexExpr,
+    InitItem,
+    InitList,
+    IntLiteral,
+    Param,
+    ReturnStmt,
+    SizeofExpr,
+    StaticAssertDecl,
+    Stmt,
+    StringLiteral,
+    TranslationUnit,
+    TypeSpec,
+    UnaryExpr,
+    WhileStmt,
+    ARRAY_OP_KIND,
+    BASE_TYPE_SIZES,
+    FUNC_OP,
+    POINTER_OP,
+    make_identifier,
+    make_init_list,
+    make_int_literal,
+    make_type_spec,
+)
+from xcc.lexer import Token, TokenKind
+
+EXTERNAL_STATEMENT_KEYWORDS = frozenset(
+    {
+        "break", "case", "continue", "default", "do", "else", "for", "goto",
+        "if", "return", "switch", "while",
+    }
+)
+
+SIMPLE_TYPE_SPEC_KEYWORDS = frozenset(
+    {"void", "char", "short", "int", "long", "float", "double", "signed", "unsigned", "_Bool"}
+)
+
+FLOATING_TYPE_KEYWORDS = frozenset({"float", "double"})
+
+TYPE_QUALIFIER_KEYWORDS = frozenset({"const", "volatile", "restrict"})
+
+STORAGE_CLASS_KEYWORDS = frozenset({"auto", "extern", "register", "static", "typedef"})
+
+ASSIGNMENT_OPS = frozenset({"=", "*=", "/=", "%=", "+=", "-=", "<<=", ">>=", "&=", "^=", "|="})
+
+# Binary operators from lowest to highest precedence tier.
+BINARY_OP_TIERS: tuple[frozenset[str], ...] = (
+    frozenset({"||"}),
+    frozenset({"&&"}),
+    frozenset({"|"}),
+    frozenset({"^"}),
+    frozenset({"&"}),
+    frozenset({"==", "!="}),
+    frozenset({"<", ">", "<=", ">="}),
+    frozenset({"<<", ">>"}),
+    frozenset({"+", "-"}),
+    frozenset({"*", "/", "%"}),
+)
+
+UNARY_OPS = frozenset({"+", "-", "!", "~", "*", "&", "++", "--"})
+
+_INTEGER_LITERAL_SUFFIXES = frozenset({"", "u", "l", "ll", "ul", "lu", "ull", "llu"})
+
+
+# Memoized: integer literals are flyweights, and array sizes, enumerator
+# initializers, and constant folding re-evaluate the same lexemes. The
+# error case stays None here so the caller can raise at its own position.
+@functools.lru_cache(maxsize=256)
+def _int_literal_value(lexeme: str) -> int | None:
+    body = lexeme.rstrip("uUlL")
+    suffix = lexeme[len(body):].lower()
+    if suffix not in _INTEGER_LITERAL_SUFFIXES:
+        return None
+    if body.startswith(("0x", "0X")):
+        return int(body, 16)
+    if body.startswith("0") and len(body) > 1:
+        if body.strip("01234567"):
+            return None
+        return int(body, 8)
+    return int(body, 10)
+
+
+# Punctuators whose type-position diagnostic reads better as "missing
+# before" than "cannot start with": separators and closers that imply
+# the type was simply omitted. Every other punctuator shares one
+# template, which replaces two ~40-entry literal tables.
+_MISSING_BEFORE_PUNCTUATORS = frozenset({"{", "<%", "]", ":>", ",", ":", ";", "?"})
+
+# Hoisted kind sets and dispatch: enum members are not compile-time
+# constants, so an inline {TokenKind.X, TokenKind.Y} literal would be
+# rebuilt on every check.
+_KEYWORD_OR_IDENT = frozenset({TokenKind.KEYWORD, TokenKind.IDENT})
+
+_TYPE_MESSAGE_NOUNS = {
+    TokenKind.INT_CONST: "number ",
+    TokenKind.FLOAT_CONST: "number ",
+    TokenKind.STRING: "string ",
+    TokenKind.CHAR_CONST: "character constant ",
+}
+
+
+# Pointer declarator runs reuse one tuple per depth. A plain
+# pointer_depth bump on the TypeSpec would be cheaper still, but
+# declarator_ops is the source of truth once array or function suffixes
+# get appended, so the op chain has to stay populated.
+@functools.lru_cache(maxsize=None)
+def _pointer_ops(depth: int) -> tuple:
+    return (POINTER_OP,) * depth
+
+
+def _match_attribute_span(tokens: list[Token], index: int, count: int) -> int | None:
+    """Return the index just past ``__attribute__((...))`` at ``index``.
+
+    Returns None when the sequence is malformed or unterminated; the
+    caller then leaves skipping to the strict parse for its diagnostics.
+    """
+    opener = tokens[index + 1] if index + 1 < count else None
+    inner = tokens[index + 2] if index + 2 < count else None
+    if opener is None or opener.kind is not TokenKind.PUNCT or opener.lexeme != "(":
+        return None
+    if inner is None or inner.kind is not TokenKind.PUNCT or inner.lexeme != "(":
+        return None
+    depth = 2
+    scan = index + 3
+    while depth > 0 and scan < count:
+        token = tokens[scan]
+        if token.kind is TokenKind.EOF:
+            return None
+        if token.kind is TokenKind.PUNCT:
+            if token.lexeme == "(":
+                depth += 1
+            elif token.lexeme == ")":
+                depth -= 1
+        scan += 1
+    return scan if depth == 0 else None
+
+
+def _build_skip_tables(tokens: list[Token]) -> tuple[list[int], list[int]]:
+    """Precompute where `__extension__` and `__attribute__` runs end.
+
+    ``ext_to[i]`` / ``attr_to[i]`` give the first index at or after ``i``
+    past any run of the respective markers; unaffected indices map to
+    themselves. One right-to-left pass makes consecutive runs transitive,
+    so the skip helpers become a single table lookup even when a failed
+    function probe rewinds and skips the same tokens again.
+    """
+    count = len(tokens)
+    ext_to = list(range(count))
+    attr_to = list(range(count))
+    for index in range(count - 2, -1, -1):
+        token = tokens[index]
+        if token.kind is not TokenKind.IDENT:
+            continue
+        if token.lexeme == "__extension__":
+            ext_to[index] = ext_to[index + 1]
+        elif token.lexeme == "__attribute__":
+            end = _match_attribute_span(tokens, index, count)
+            if end is not None and end < count:
+                attr_to[index] = attr_to[end]
+    return ext_to, attr_to
+
+
+def _cast_array_size_message(expr: CastExpr, eval_expr: Callable) -> str:
+    if expr.target_type.pointer_depth:
+        return "array size cannot be cast to a pointer type"
+    return (
+        f"array size cast to {expr.target_type.describe()!r} is not an integer "
+        "constant expression"
+    )
+
+
+def _conditional_array_size_message(expr: ConditionalExpr, eval_expr: Callable) -> str:
+    condition = eval_expr(expr.condition)
+    if condition is None:
+        return "array size conditional has a non-constant condition"
+    if condition:
+        return "array size conditional selects a non-constant true branch"
+    return "array size conditional selects a non-constant false branch"
+
+
+# Diagnostic dispatch for non-constant array sizes, keyed on the concrete
+# node class: one dict probe replaces the isinstance cascade this used to
+# be. Every AST node is a leaf class, so type(expr) is an exact match.
+_ARRAY_SIZE_ICE_HANDLERS: dict[type, Callable[[Expr, Callable], str]] = {
+    Identifier: lambda expr, _eval: (
+        f"array size identifier {expr.name!r} is not an integer constant expression"
+    ),
+    StringLiteral: lambda expr, _eval: "array size cannot be a string literal",
+    FloatLiteral: lambda expr, _eval: (
+        f"array size {expr.value!r} is not an integer constant"
+    ),
+    CharConstant: lambda expr, _eval: (
+        f"array size character constant {expr.value!r} is not supported here"
+    ),
+    CallExpr: lambda expr, _eval: "array size cannot contain a function call",
+    AssignExpr: lambda expr, _eval: "array size cannot contain an assignment",
+    InitList: lambda expr, _eval: "array size cannot be an initializer list",
+    UnaryExpr: lambda expr, _eval: (
+        f"array size operand of unary {expr.op!r} is not an integer constant expression"
+    ),
+    BinaryExpr: lambda expr, _eval: (
+        f"array size operand of binary {expr.op!r} is not an integer constant expression"
+    ),
+    CastExpr: _cast_array_size_message,
+    ConditionalExpr: _conditional_array_size_message,
+    SizeofExpr: lambda expr, _eval: (
+        "array size sizeof operand is not a complete constant type"
+    ),
+    IndexExpr: lambda expr, _eval: "array size cannot index into an array",
+}
+
+
+class ParserError(Exception):
+    """Parse failure; ``message`` may be passed as a zero-arg callable.
+
+    The speculative function probe raises and swallows these without ever
+    reading the message, so hot raise sites defer the f-string formatting
+    behind a lambda that only runs if the message is actually rendered.
+    """
+
+    def __init__(self, message: str | Callable[[], str], token: Token | None = None) -> None:
+        super().__init__()
+        self._message = message
+        self.token = token
+        self.line = token.line if token is not None else 0
+        self.column = token.column if token is not None else 0
+
+    @property
+    def message(self) -> str:
+        message = self._message
+        if not isinstance(message, str):
+            message = self._message = message()
+        return message
+
+    def __str__(self) -> str:
+        if self.token is None:
+            return self.message
+        return f"{self.line}:{self.column}: {self.message}"
+
+
+class Parser:
+    def __init__(self, tokens: list[Token], filename: str = "<string>") -> None:
+        self._tokens = list(tokens)
+        self._filename = filename
+        self._index = 0
+        # Scope state is flattened: each name maps to a stack of entries
+        # tagged with the scope depth that defined it, so lookups are one
+        # dict probe instead of a walk over every enclosing scope. The
+        # per-scope undo logs record what _pop_scope must unwind.
+        self._typedef_flat: dict[str, list[tuple[int, TypeSpec, bool]]] = {}
+        self._ordinary_flat: dict[str, list[tuple[int, TypeSpec]]] = {}
+        self._scope_undo: list[list[tuple[dict, str]]] = [[]]
+        # Packrat cache for the _looks_like_function probe: (index, scope
+        # version) -> (verdict, parsed span). Any name definition or scope
+        # change bumps the version, which retires the affected entries.
+        self._scope_version = 0
+        self._ext_skip_to, self._attr_skip_to = _build_skip_tables(self._tokens)
+        self._lookahead_cache: dict[
+            tuple[int, int],
+            tuple[bool, tuple[tuple[str, ...], TypeSpec, str, tuple[Param, ...], int] | None],
+        ] = {}
+
+    # ------------------------------------------------------------------
+    # Token access helpers
+
+    def _current(self) -> Token:
+        return self._tokens[self._index]
+
+    def _peek(self, offset: int = 1) -> Token:
+        index = min(self._index + offset, len(self._tokens) - 1)
+        return self._tokens[index]
+
+    def _advance(self) -> Token:
+        token = self._tokens[self._index]
+        if token.kind is not TokenKind.EOF:
+            self._index += 1
+        return token
+
+    def _at_end(self) -> bool:
+        return self._current().kind is TokenKind.EOF
+
+    def _check_punct(self, value: str) -> bool:
+        # Enum members are singletons, so `is` skips Enum.__eq__; the lexeme
+        # compare usually resolves on pointer equality too, since the lexer
+        # hands out interned canonical spellings.
+        token = self._current()
+        return token.kind is TokenKind.PUNCT and token.lexeme == value
+
+    def _check_keyword(self, value: str) -> bool:
+        token = self._current()
+        return token.kind is TokenKind.KEYWORD and token.lexeme == value
+
+    def _match_punct(self, value: str) -> bool:
+        if self._check_punct(value):
+            self._advance()
+            return True
+        return False
+
+    def _match_keyword(self, value: str) -> bool:
+        if self._check_keyword(value):
+            self._advance()
+            return True
+        return False
+
+    def _expect_punct(self, value: str) -> Token:
+        if not self._check_punct(value):
+            token = self._current()
+            raise ParserError(lambda: f"expected {value!r}, found {token.lexeme!r}", token)
+        return self._advance()
+
+    def _expect(self, kind: TokenKind) -> Token:
+        token = self._current()
+        if token.kind is not kind:
+            raise ParserError(lambda: f"expected {kind.name}, found {token.lexeme!r}", token)
+        return self._advance()
+
+    # ------------------------------------------------------------------
+    # Scope management
+
+    def _push_scope(self) -> None:
+        self._scope_version += 1
+        self._scope_undo.append([])
+
+    def _pop_scope(self) -> None:
+        self._scope_version += 1
+        for flat, name in self._scope_undo.pop():
+            stack = flat[name]
+            stack.pop()
+            if not stack:
+                del flat[name]
+
+    def _define_typedef(self, name: str, type_spec: TypeSpec) -> None:
+        self._scope_version += 1
+        depth = len(self._scope_undo) - 1
+        stack = self._typedef_flat.get(name)
+        if stack is None:
+            stack = self._typedef_flat[name] = []
+        stack.append((depth, type_spec, bool(type_spec.qualifiers)))
+        self._scope_undo[-1].append((self._typedef_flat, name))
+
+    def _define_ordinary(self, name: str, type_spec: TypeSpec) -> None:
+        # Ordinary names shadow typedefs in _lookup_typedef, so they change
+        # probe verdicts too and must retire cached lookahead entries.
+        self._scope_version += 1
+        depth = len(self._scope_undo) - 1
+        stack = self._ordinary_flat.get(name)
+        if stack is None:
+            stack = self._ordinary_flat[name] = []
+        stack.append((depth, type_spec))
+        self._scope_undo[-1].append((self._ordinary_flat, name))
+
+    def _lookup_typedef(self, name: str) -> TypeSpec | None:
+        stack = self._typedef_flat.get(name)
+        if not stack:
+            return None
+        # An ordinary name defined in the same or a nested scope shadows
+        # the typedef; the recorded depths settle it without a scope walk.
+        ordinary = self._ordinary_flat.get(name)
+        if ordinary and ordinary[-1][0] >= stack[-1][0]:
+            return None
+        return stack[-1][1]
+
+    def _lookup_ordinary_type(self, name: str) -> TypeSpec | None:
+        stack = self._ordinary_flat.get(name)
+        return stack[-1][1] if stack else None
+
+    def _is_top_level_qualified_typedef(self, name: str) -> bool:
+        stack = self._typedef_flat.get(name)
+        return stack[-1][2] if stack else False
+
+    def _is_typedef_name(self, name: str) -> bool:
+        return self._lookup_typedef(name) is not None
+
+    # ------------------------------------------------------------------
+    # GNU extension skipping
+
+    def _skip_extension_markers(self) -> None:
+        self._index = self._ext_skip_to[self._index]
+
+    def _skip_gnu_attributes(self) -> None:
+        self._index = self._attr_skip_to[self._index]
+        token = self._current()
+        if token.kind is not TokenKind.IDENT or token.lexeme != "__attribute__":
+            return
+        # Only a malformed or unterminated attribute lands here (the skip
+        # table maps those to themselves); replay the strict parse so the
+        # diagnostics and their positions are unchanged.
+        while True:
+            token = self._current()
+            if token.kind is not TokenKind.IDENT or token.lexeme != "__attribute__":
+                return
+            self._advance()
+            self._expect_punct("(")
+            self._expect_punct("(")
+            depth = 2
+            while depth > 0:
+                if self._at_end():
+                    raise ParserError("unterminated __attribute__", self._current())
+                if self._check_punct("("):
+                    depth += 1
+                elif self._check_punct(")"):
+                    depth -= 1
+                self._advance()
+
+    # ------------------------------------------------------------------
+    # Entry point
+
+    def parse(self) -> TranslationUnit:
+        functions: list[FunctionDef] = []
+        declarations: list[Declaration] = []
+        externals: list[Declaration] = []
+        while not self._at_end():
+            self._skip_extension_markers()
+            self._skip_gnu_attributes()
+            if self._at_end():
+                break
+            token = self._current()
+            if self._check_keyword("_Static_assert"):
+                self._parse_static_assert()
+                continue
+            if token.kind is TokenKind.KEYWORD and token.lexeme in EXTERNAL_STATEMENT_KEYWORDS:
+                raise ParserError(
+                    f"statement keyword {token.lexeme!r} is not valid at file scope", token
+                )
+            if not self._looks_like_plain_declaration() and self._looks_like_function():
+                functions.append(self._parse_function())
+                continue
+            for declaration in self._parse_declaration():
+                if "extern" in declaration.storage:
+                    externals.append(declaration)
+                else:
+                    declarations.append(declaration)
+        return TranslationUnit(
+            filename=self._filename,
+            functions=tuple(functions),
+            declarations=tuple(declarations),
+            externals=tuple(externals),
+        )
+
+    # ------------------------------------------------------------------
+    # Function / declaration recognition
+
+    def _looks_like_plain_declaration(self) -> bool:
+        """Cheap pre-filter: True when the upcoming external construct is
+        certainly not a function definition.
+
+        A flat token scan settles the common cases -- a top-level ``;`` or
+        ``=`` before any brace means a declaration, and a function body's
+        ``{`` is always preceded by the ``)`` closing the parameter list (or
+        a trailing attribute). Record and enum bodies are skipped by brace
+        matching so ``struct S { ... } s;`` still reads as a declaration.
+        Anything odd returns False and falls through to the precise
+        speculative probe, so diagnostics are unaffected.
+        """
+        tokens = self._tokens
+        index = self._index
+        count = len(tokens)
+        paren_depth = 0
+        pending_record_body = False
+        previous = None
+        while index < count:
+            token = tokens[index]
+            kind = token.kind
+            if kind is TokenKind.EOF:
+                return False
+            if kind is TokenKind.PUNCT:
+                lexeme = token.lexeme
+                if lexeme == "(":
+                    paren_depth += 1
+                elif lexeme == ")":
+                    paren_depth -= 1
+                    if paren_depth < 0:
+                        return False
+                elif paren_depth == 0:
+                    if lexeme == ";" or lexeme == "=":
+                        return True
+                    if lexeme == "{":
+                        if (
+                            previous is not None
+                            and previous.kind is TokenKind.PUNCT
+                            and previous.lexeme == ")"
+                        ):
+                            return False
+                        if pending_record_body:
+                            brace_depth = 1
+                            index += 1
+                            while index < count and brace_depth:
+                                inner = tokens[index]
+                                if inner.kind is TokenKind.EOF:
+                                    return False
+                                if inner.kind is TokenKind.PUNCT:
+                                    if inner.lexeme == "{":
+                                        brace_depth += 1
+                                    elif inner.lexeme == "}":
+                                        brace_depth -= 1
+                                index += 1
+                            pending_record_body = False
+                            previous = tokens[index - 1]
+                            continue
+                        return True
+            elif kind is TokenKind.KEYWORD and token.lexeme in ("struct", "union", "enum"):
+                pending_record_body = True
+            previous = token
+            index += 1
+        return False
+
+    def _looks_like_function(self) -> bool:
+        key = (self._index, self._scope_version)
+        cached = self._lookahead_cache.get(key)
+        if cached is not None:
+            return cached[0]
+        saved_index = self._index
+        result = False
+        probe: tuple[tuple[str, ...], TypeSpec, str, tuple[Param, ...], int] | None = None
+        try:
+            storage = self._parse_decl_specs()
+            return_type = self._parse_type_spec(context="declaration")
+            self._skip_gnu_attributes()
+            if self._current().kind is TokenKind.IDENT:
+                name_token = self._advance()
+                if self._check_punct("("):
+                    params = self._parse_params()
+                    self._skip_gnu_attributes()
+                    result = self._check_punct("{")
+                    if result:
+                        probe = (
+                            storage, return_type, name_token.lexeme, params, self._index
+                        )
+        except ParserError:
+            result = False
+        finally:
+            self._index = saved_index
+        self._lookahead_cache[key] = (result, probe)
+        return result
+
+    def _parse_function(self) -> FunctionDef:
+        # A positive probe already parsed the specs, name, and parameter
+        # list; packrat-style, reuse its span instead of parsing it again.
+        cached = self._lookahead_cache.get((self._index, self._scope_version))
+        if cached is not None and cached[1] is not None:
+            storage, return_type, function_name, params, end_index = cached[1]
+            self._index = end_index
+        else:
+            storage = self._parse_decl_specs()
+            return_type = self._parse_type_spec(context="declaration")
+            self._skip_gnu_attributes()
+            name_token = self._expect(TokenKind.IDENT)
+            function_name = name_token.lexeme
+            params = self._parse_params()
+            self._skip_gnu_attributes()
+        self._define_ordinary(function_name, return_type)
+        self._push_scope()
+        for param in params:
+            if param.name is not None:
+                self._define_ordinary(param.name, param.param_type)
+        try:
+            body = self._parse_compound()
+        finally:
+            self._pop_scope()
+        return FunctionDef(
+            name=function_name,
+            return_type=return_type,
+            params=params,
+            body=body,
+            storage=storage,
+        )
+
+    def _parse_params(self) -> tuple[Param, ...]:
+        self._expect_punct("(")
+        params: list[Param] = []
+        if self._check_punct(")"):
+            self._advance()
+            return tuple(params)
+        if self._check_keyword("void") and self._peek().kind is TokenKind.PUNCT and self._peek().lexeme == ")":
+            self._advance()
+            self._advance()
+            return tuple(params)
+        while True:
+            if self._check_punct("..."):
+                self._advance()
+                params.append(Param(name=None, param_type=make_type_spec("...")))
+                break
+            params.append(self._parse_param())
+            if not self._match_punct(","):
+                break
+        self._expect_punct(")")
+        return tuple(params)
+
+    def _parse_param(self) -> Param:
+        self._skip_extension_markers()
+        self._parse_decl_specs()
+        param_type = self._parse_type_spec(context="type name")
+        self._skip_gnu_attributes()
+        name: str | None = None
+        if self._current().kind is TokenKind.IDENT:
+            token = self._advance()
+            name = token.lexeme
+        ops = []
+        while self._check_punct("["):
+            self._advance()
+            if self._check_punct("]"):
+                self._advance()
+                ops.append((ARRAY_OP_KIND, None))
+            else:
+                ops.append((ARRAY_OP_KIND, self._parse_array_size()))
+                self._expect_punct("]")
+        if ops:
+            param_type = self._build_declarator_type(param_type, tuple(ops))
+        return Param(name=name, param_type=param_type)
+
+    # ------------------------------------------------------------------
+    # Declarations
+
+    def _parse_static_assert(self) -> StaticAssertDecl:
+        self._advance()  # _Static_assert
+        self._expect_punct("(")
+        condition = self._parse_conditional()
+        message: str | None = None
+        if self._match_punct(","):
+            token = self._expect(TokenKind.STRING)
+            message = token.lexeme
+        self._expect_punct(")")
+        self._expect_punct(";")
+        return StaticAssertDecl(condition=condition, message=message)
+
+    def _parse_decl_specs(self) -> tuple[str, ...]:
+        storage: list[str] = []
+        # Locals hold the bound methods: sub-parsers share self._index, so
+        # the index itself cannot be mirrored into a local, but the
+        # attribute loads can be paid once per call instead of per token.
+        current = self._current
+        advance = self._advance
+        while True:
+            token = current()
+            if token.kind is not TokenKind.KEYWORD:
+                return tuple(storage)
+            if token.lexeme in STORAGE_CLASS_KEYWORDS:
+                storage.append(token.lexeme)
+                advance()
+            elif token.lexeme in ("inline", "_Noreturn"):
+                advance()
+            else:
+                return tuple(storage)
+
+    def _parse_declaration(self) -> list[Declaration]:
+        self._skip_extension_markers()
+        storage = self._parse_decl_specs()
+        base_type = self._parse_type_spec(context="declaration", parse_pointer_depth=False)
+        self._skip_gnu_attributes()
+        declarations: list[Declaration] = []
+        if self._check_punct(";"):
+            # Bare struct/union/enum declaration.
+            self._advance()
+            return declarations
+        while True:
+            name, decl_type = self._parse_declarator(base_type)
+            self._skip_gnu_attributes()
+            initializer: Expr | None = None
+            if "typedef" in storage:
+                self._define_typedef(name, decl_type)
+            else:
+                self._define_ordinary(name, decl_type)
+                if self._match_punct("="):
+                    initializer = self._parse_initializer()
+            declarations.append(
+                Declaration(name=name, decl_type=decl_type, initializer=initializer, storage=storage)
+            )
+            if not self._match_punct(","):
+                break
+        self._expect_punct(";")
+        if "typedef" in storage:
+            return []
+        return declarations
+
+    def _parse_declarator(self, base_type: TypeSpec) -> tuple[str, TypeSpec]:
+        ops: list[DeclaratorOp] = []
+        while self._check_punct("*"):
+            self._advance()
+            while self._current().kind is TokenKind.KEYWORD and self._current().lexeme in TYPE_QUALIFIER_KEYWORDS:
+                self._advance()
+            ops.append(POINTER_OP)
+        name_token = self._expect(TokenKind.IDENT)
+        name = name_token.lexeme
+        while True:
+            if self._check_punct("["):
+                self._advance()
+                if self._check_punct("]"):
+                    self._advance()
+                    ops.append((ARRAY_OP_KIND, None))
+                else:
+                    ops.append((ARRAY_OP_KIND, self._parse_array_size()))
+                    self._expect_punct("]")
+            elif self._check_punct("("):
+                self._parse_params()
+                ops.append(FUNC_OP)
+            else:
+                break
+        decl_type = self._build_declarator_type(base_type, tuple(ops)) if ops else base_type
+        return name, decl_type
+
+    def _build_declarator_type(self, base_type: TypeSpec, ops: tuple) -> TypeSpec:
+        return dataclasses.replace(
+            base_type, declarator_ops=tuple(base_type.declarator_ops) + tuple(ops)
+        )
+
+    def _parse_array_size(self) -> int:
+        expr = self._parse_conditional()
+        value = self._eval_ice(expr)
+        if value is None:
+            raise ParserError(self._array_size_non_ice_error(expr, self._eval_ice), self._current())
+        if value < 0:
+            raise ParserError(f"array size must be non-negative, got {value}", self._current())
+        return value
+
+    def _parse_initializer(self) -> Expr:
+        if not self._check_punct("{"):
+            return self._parse_assignment()
+        self._advance()
+        items: list[InitItem] = []
+        if self._match_punct("}"):
+            return make_init_list(items)
+        while True:
+            designator: str | None = None
+            if self._check_punct("."):
+                self._advance()
+                token = self._expect(TokenKind.IDENT)
+                designator = token.lexeme
+                self._expect_punct("=")
+            items.append(InitItem(value=self._parse_initializer(), designator=designator))
+            if not self._match_punct(","):
+                break
+            if self._check_punct("}"):
+                break
+        self._expect_punct("}")
+        return make_init_list(items)
+
+    # ------------------------------------------------------------------
+    # Type specifiers
+
+    def _parse_type_spec(
+        self, parse_pointer_depth: bool = True, context: str = "declaration"
+    ) -> TypeSpec:
+        qualifiers = self._parse_type_qualifiers()
+        token = self._current()
+        if token.kind is TokenKind.PUNCT:
+            if context == "type name":
+                message = lambda: self._unsupported_type_name_punctuator_message(token.lexeme)
+            else:
+                message = lambda: self._unsupported_declaration_type_punctuator_message(
+                    token.lexeme
+                )
+            raise ParserError(message, token)
+        if token.kind not in _KEYWORD_OR_IDENT:
+            raise ParserError(lambda: self._unsupported_type_message(token), token)
+        if token.kind is TokenKind.KEYWORD:
+            lexeme = token.lexeme
+            handler = _TYPE_SPEC_HANDLERS.get(lexeme)
+            if handler is None:
+                raise ParserError(lambda: self._unsupported_type_message(token), token)
+            return handler(self, token, lexeme, qualifiers, parse_pointer_depth, context)
+        # Identifier: typedef name.
+        name = token.lexeme
+        aliased = self._lookup_typedef(name)
+        if aliased is None:
+            raise ParserError(lambda: f"unknown type name {name!r}", token)
+        self._advance()
+        return self._finish_type_spec(aliased, qualifiers, parse_pointer_depth)
+
+    # The _TYPE_SPEC_HANDLERS table below dispatches keyword-led type
+    # specifiers to these handlers; all share one signature so the table
+    # stays homogeneous.
+
+    def _type_spec_atomic(
+        self,
+        token: Token,
+        lexeme: str,
+        qualifiers: tuple[str, ...],
+        parse_pointer_depth: bool,
+        context: str,
+    ) -> TypeSpec:
+        self._advance()
+        if self._match_punct("("):
+            atomic_type = self._parse_type_spec(parse_pointer_depth=False, context="type name")
+            self._expect_punct(")")
+        else:
+            atomic_type = self._parse_type_spec(parse_pointer_depth=False, context=context)
+        pointer_depth = self._parse_pointer_depth() if parse_pointer_depth else 0
+        return self._finalize_type_spec(atomic_type, qualifiers, pointer_depth, is_atomic=True)
+
+    def _type_spec_unsupported(
+        self,
+        token: Token,
+        lexeme: str,
+        qualifiers: tuple[str, ...],
+        parse_pointer_depth: bool,
+        context: str,
+    ) -> TypeSpec:
+        raise ParserError(f"{lexeme} types are not supported", token)
+
+    def _type_spec_named(
+        self,
+        token: Token,
+        lexeme: str,
+        qualifiers: tuple[str, ...],
+        parse_pointer_depth: bool,
+        context: str,
+    ) -> TypeSpec:
+        self._advance()
+        return self._finish_type_spec(make_type_spec(lexeme), qualifiers, parse_pointer_depth)
+
+    def _type_spec_record(
+        self,
+        token: Token,
+        lexeme: str,
+        qualifiers: tuple[str, ...],
+        parse_pointer_depth: bool,
+        context: str,
+    ) -> TypeSpec:
+        return self._finish_type_spec(self._parse_record_type(), qualifiers, parse_pointer_depth)
+
+    def _type_spec_enum(
+        self,
+        token: Token,
+        lexeme: str,
+        qualifiers: tuple[str, ...],
+        parse_pointer_depth: bool,
+        context: str,
+    ) -> TypeSpec:
+        return self._finish_type_spec(self._parse_enum_type(), qualifiers, parse_pointer_depth)
+
+    def _type_spec_simple(
+        self,
+        token: Token,
+        lexeme: str,
+        qualifiers: tuple[str, ...],
+        parse_pointer_depth: bool,
+        context: str,
+    ) -> TypeSpec:
+        return self._finish_type_spec(self._parse_simple_type(), qualifiers, parse_pointer_depth)
+
+    def _finish_type_spec(
+        self, type_spec: TypeSpec, qualifiers: tuple[str, ...], parse_pointer_depth: bool
+    ) -> TypeSpec:
+        qualifiers = qualifiers + self._parse_type_qualifiers()
+        pointer_depth = self._parse_pointer_depth() if parse_pointer_depth else 0
+        return self._finalize_type_spec(type_spec, qualifiers, pointer_depth)
+
+    def _finalize_type_spec(
+        self,
+        type_spec: TypeSpec,
+        qualifiers: tuple[str, ...],
+        pointer_depth: int,
+        is_atomic: bool = False,
+    ) -> TypeSpec:
+        """Apply pointer ops, qualifiers, and the atomic flag in one copy.
+
+        Chaining single-field ``dataclasses.replace`` helpers re-ran
+        ``TypeSpec.__post_init__`` (declarator rederivation plus the cached
+        hash) once per applied field; collecting the changes first pays for
+        one reconstruction, or none when the spec is already final.
+        """
+        changes: dict[str, object] = {}
+        if is_atomic and not type_spec.is_atomic:
+            changes["is_atomic"] = True
+        if pointer_depth:
+            changes["declarator_ops"] = type_spec.declarator_ops + _pointer_ops(pointer_depth)
+        if qualifiers:
+            merged = tuple(sorted(set(type_spec.qualifiers) | set(qualifiers)))
+            if merged != type_spec.qualifiers:
+                changes["qualifiers"] = merged
+        if not changes:
+            return type_spec
+        return dataclasses.replace(type_spec, **changes)
+
+    def _parse_type_qualifiers(self) -> tuple[str, ...]:
+        qualifiers: list[str] = []
+        current = self._current
+        advance = self._advance
+        while True:
+            token = current()
+            if token.kind is TokenKind.KEYWORD and token.lexeme in TYPE_QUALIFIER_KEYWORDS:
+                qualifiers.append(token.lexeme)
+                advance()
+            else:
+                return tuple(qualifiers)
+
+    def _parse_pointer_depth(self) -> int:
+        depth = 0
+        while self._check_punct("*"):
+            self._advance()
+            depth += 1
+            self._parse_type_qualifiers()
+        return depth
+
+    def _parse_simple_type(self) -> TypeSpec:
+        words: list[str] = []
+        current = self._current
+        advance = self._advance
+        while True:
+            token = current()
+            if token.kind is TokenKind.KEYWORD and token.lexeme in SIMPLE_TYPE_SPEC_KEYWORDS:
+                words.append(token.lexeme)
+                advance()
+            else:
+                break
+        core = [word for word in words if word not in ("signed", "unsigned")]
+        unsigned = "unsigned" in words
+        if not core:
+            name = "int"
+        elif core == ["long", "long"] or core == ["long", "long", "int"]:
+            name = "long long"
+        elif core[-1] == "int" and len(core) > 1:
+            name = " ".join(core[:-1])
+        else:
+            name = " ".join(core)
+        if name not in BASE_TYPE_SIZES and name not in ("long long",):
+            raise ParserError(f"invalid type specifier combination: {' '.join(words)!r}", self._current())
+        if unsigned:
+            name = f"unsigned {name}"
+        elif "signed" in words and name == "char":
+            name = "signed char"
+        return make_type_spec(name)
+
+    def _parse_record_type(self) -> TypeSpec:
+        keyword = self._advance()  # struct | union
+        kind_name = keyword.lexeme
+        self._skip_gnu_attributes()
+        tag: str | None = None
+        if self._current().kind is TokenKind.IDENT:
+            token = self._advance()
+            tag = token.lexeme
+        members: list = []
+        if self._check_punct("{"):
+            self._advance()
+            while not self._check_punct("}"):
+                member_base = self._parse_type_spec(parse_pointer_depth=False, context="type name")
+                while True:
+                    member_name, member_type = self._parse_declarator(member_base)
+                    bit_width: int | None = None
+                    if self._match_punct(":"):
+                        bit_width = self._parse_array_size()
+                    if bit_width is None:
+                        members.append((member_name, member_type))
+                    else:
+                        members.append((member_name, member_type, bit_width))
+                    if not self._match_punct(","):
+                        break
+                self._expect_punct(";")
+            self._expect_punct("}")
+        elif tag is None:
+            raise ParserError(f"{kind_name} requires a tag or member list", self._current())
+        return TypeSpec(name=kind_name, record_tag=tag, record_members=tuple(members))
+
+    def _parse_enum_type(self) -> TypeSpec:
+        self._advance()  # enum
+        self._skip_gnu_attributes()
+        tag: str | None = None
+        if self._current().kind is TokenKind.IDENT:
+            token = self._advance()
+            tag = token.lexeme
+        members: list[tuple[str, int]] = []
+        if self._check_punct("{"):
+            self._advance()
+            next_value = 0
+            while not self._check_punct("}"):
+                name_token = self._expect(TokenKind.IDENT)
+                if self._match_punct("="):
+                    expr = self._parse_conditional()
+                    value = self._eval_ice(expr)
+                    if value is None:
+                        raise ParserError(
+                            "enumerator value must be an integer constant expression",
+                            self._current(),
+                        )
+                    next_value = value
+                members.append((name_token.lexeme, next_value))
+                next_value += 1
+                if not self._match_punct(","):
+                    break
+            self._expect_punct("}")
+        elif tag is None:
+            raise ParserError("enum requires a tag or enumerator list", self._current())
+        return TypeSpec(name="enum", enum_tag=tag, enum_members=tuple(members))
+
+    # ------------------------------------------------------------------
+    # Statements
+
+    def _parse_compound(self) -> CompoundStmt:
+        self._expect_punct("{")
+        self._push_scope()
+        statements: list[Stmt] = []
+        try:
+            while not self._check_punct("}"):
+                if self._at_end():
+                    raise ParserError("unterminated compound statement", self._current())
+                statements.append(self._parse_statement())
+        finally:
+            self._pop_scope()
+        self._expect_punct("}")
+        return CompoundStmt(statements=tuple(statements))
+
+    def _parse_statement(self) -> Stmt:
+        self._skip_extension_markers()
+        token = self._current()
+        if token.kind is TokenKind.PUNCT and token.lexeme == "{":
+            return self._parse_compound()
+        if token.kind is TokenKind.PUNCT and token.lexeme == ";":
+            self._advance()
+            return CompoundStmt()
+        if token.kind is TokenKind.KEYWORD:
+            if token.lexeme == "return":
+                self._advance()
+                value: Expr | None = None
+                if not self._check_punct(";"):
+                    value = self._parse_expression()
+                self._expect_punct(";")
+                return ReturnStmt(value=value)
+            if token.lexeme == "if":
+                self._advance()
+                self._expect_punct("(")
+                condition = self._parse_expression()
+                self._expect_punct(")")
+                then_branch = self._parse_statement()
+                else_branch: Stmt | None = None
+                if self._match_keyword("else"):
+                    else_branch = self._parse_statement()
+                return IfStmt(condition=condition, then_branch=then_branch, else_branch=else_branch)
+            if token.lexeme == "while":
+                self._advance()
+                self._expect_punct("(")
+                condition = self._parse_expression()
+                self._expect_punct(")")
+                body = self._parse_statement()
+                return WhileStmt(condition=condition, body=body)
+            if token.lexeme == "break":
+                self._advance()
+                self._expect_punct(";")
+                return BreakStmt()
+            if token.lexeme == "continue":
+                self._advance()
+                self._expect_punct(";")
+                return ContinueStmt()
+            if token.lexeme == "_Static_assert":
+                return self._parse_static_assert()
+            if (
+                token.lexeme in SIMPLE_TYPE_SPEC_KEYWORDS
+                or token.lexeme in TYPE_QUALIFIER_KEYWORDS
+                or token.lexeme in STORAGE_CLASS_KEYWORDS
+                or token.lexeme in ("struct", "union", "enum", "_Atomic")
+            ):
+                return self._parse_decl_stmt()
+            raise ParserError(f"unsupported statement keyword {token.lexeme!r}", token)
+        if token.kind is TokenKind.IDENT and self._is_typedef_name(token.lexeme):
+            return self._parse_decl_stmt()
+        expr = self._parse_expression()
+        self._expect_punct(";")
+        return ExprStmt(expr=expr)
+
+    def _parse_decl_stmt(self) -> Stmt:
+        declarations = self._parse_declaration()
+        return DeclGroupStmt(declarations=tuple(declarations))
+
+    # ------------------------------------------------------------------
+    # Expressions
+
+    def _parse_expression(self) -> Expr:
+        expr = self._parse_assignment()
+        while self._match_punct(","):
+            right = self._parse_assignment()
+            expr = BinaryExpr(op=",", left=expr, right=right)
+        return expr
+
+    def _parse_assignment(self) -> Expr:
+        expr = self._parse_conditional()
+        token = self._current()
+        if token.kind is TokenKind.PUNCT and token.lexeme in ASSIGNMENT_OPS:
+            self._advance()
+            value = self._parse_assignment()
+            return AssignExpr(op=token.lexeme, target=expr, value=value)
+        return expr
+
+    def _parse_conditional(self) -> Expr:
+        condition = self._parse_binary(0)
+        if not self._match_punct("?"):
+            return condition
+        then_value = self._parse_expression()
+        self._expect_punct(":")
+        else_value = self._parse_conditional()
+        return ConditionalExpr(condition=condition, then_value=then_value, else_value=else_value)
+
+    def _parse_binary(self, tier: int) -> Expr:
+        if tier >= len(BINARY_OP_TIERS):
+            return self._parse_cast()
+        expr = self._parse_binary(tier + 1)
+        ops = BINARY_OP_TIERS[tier]
+        current = self._current
+        while True:
+            token = current()
+            if token.kind is TokenKind.PUNCT and token.lexeme in ops:
+                self._advance()
+                right = self._parse_binary(tier + 1)
+                expr = BinaryExpr(op=token.lexeme, left=expr, right=right)
+            else:
+                return expr
+
+    def _starts_type_name(self, token: Token) -> bool:
+        if token.kind is TokenKind.KEYWORD:
+            return (
+                token.lexeme in SIMPLE_TYPE_SPEC_KEYWORDS
+                or token.lexeme in TYPE_QUALIFIER_KEYWORDS
+                or token.lexeme in ("struct", "union", "enum", "_Atomic")
+            )
+        if token.kind is TokenKind.IDENT:
+            return self._is_typedef_name(token.lexeme)
+        return False
+
+    def _parse_cast(self) -> Expr:
+        if self._check_punct("(") and self._starts_type_name(self._peek()):
+            self._advance()
+            target_type = self._parse_type_name()
+            self._expect_punct(")")
+            operand = self._parse_cast()
+            return CastExpr(target_type=target_type, operand=operand)
+        return self._parse_unary()
+
+    def _parse_type_name(self) -> TypeSpec:
+        type_spec = self._parse_type_spec(context="type name")
+        ops = []
+        while self._check_punct("["):
+            self._advance()
+            if self._check_punct("]"):
+                self._advance()
+                ops.append((ARRAY_OP_KIND, None))
+            else:
+                ops.append((ARRAY_OP_KIND, self._parse_array_size()))
+                self._expect_punct("]")
+        if ops:
+            type_spec = self._build_declarator_type(type_spec, tuple(ops))
+        return type_spec
+
+    def _parse_unary(self) -> Expr:
+        token = self._current()
+        if token.kind is TokenKind.KEYWORD and token.lexeme == "sizeof":
+            self._advance()
+            if self._check_punct("(") and self._starts_type_name(self._peek()):
+                self._advance()
+                target_type = self._parse_type_name()
+                self._expect_punct(")")
+                return SizeofExpr(target_type=target_type, operand=None)
+            operand = self._parse_unary()
+            return SizeofExpr(target_type=None, operand=operand)
+        if token.kind is TokenKind.PUNCT and token.lexeme in UNARY_OPS:
+            self._advance()
+            operand = self._parse_cast()
+            return UnaryExpr(op=token.lexeme, operand=operand)
+        return self._parse_postfix()
+
+    def _parse_postfix(self) -> Expr:
+        expr = self._parse_primary()
+        while True:
+            if self._check_punct("("):
+                self._advance()
+                args: list[Expr] = []
+                if not self._check_punct(")"):
+                    while True:
+                        args.append(self._parse_assignment())
+                        if not self._match_punct(","):
+                            break
+                self._expect_punct(")")
+                expr = CallExpr(func=expr, args=tuple(args))
+            elif self._check_punct("["):
+                self._advance()
+                index = self._parse_expression()
+                self._expect_punct("]")
+                expr = IndexExpr(base=expr, index=index)
+            elif self._check_punct(".") or self._check_punct("->"):
+                op_token = self._advance()
+                member = self._expect(TokenKind.IDENT)
+                expr = BinaryExpr(op=op_token.lexeme, left=expr, right=make_identifier(member.lexeme))
+            elif self._check_punct("++") or self._check_punct("--"):
+                op_token = self._advance()
+                expr = UnaryExpr(op=f"post{op_token.lexeme}", operand=expr)
+            else:
+                return expr
+
+    def _parse_primary(self) -> Expr:
+        token = self._current()
+        if token.kind is TokenKind.IDENT:
+            self._advance()
+            return make_identifier(token.lexeme)
+        if token.kind is TokenKind.INT_CONST:
+            self._advance()
+            return make_int_literal(token.lexeme)
+        if token.kind is TokenKind.FLOAT_CONST:
+            self._advance()
+            return FloatLiteral(value=token.lexeme)
+        if token.kind is TokenKind.CHAR_CONST:
+            self._advance()
+            return CharConstant(value=token.lexeme)
+        if token.kind is TokenKind.STRING:
+            self._advance()
+            value = token.lexeme
+            while self._current().kind is TokenKind.STRING:
+                adjacent = self._advance()
+                value += adjacent.lexeme
+            return StringLiteral(value=value)
+        if token.kind is TokenKind.PUNCT and token.lexeme == "(":
+            self._advance()
+            expr = self._parse_expression()
+            self._expect_punct(")")
+            return expr
+        raise ParserError(f"expected expression, found {token.lexeme!r}", token)
+
+    # ------------------------------------------------------------------
+    # Integer constant expressions
+
+    def _parse_int_literal_value(self, lexeme: str) -> int:
+        value = _int_literal_value(lexeme)
+        if value is None:
+            raise ParserError(self._array_size_literal_error(lexeme), self._current())
+        return value
+
+    def _array_size_literal_error(self, lexeme: str) -> str:
+        suffix = lexeme[len(lexeme.rstrip("uUlL")):].lower()
+        if suffix and suffix not in _INTEGER_LITERAL_SUFFIXES:
+            return f"invalid integer literal suffix on {lexeme!r}"
+        return f"invalid integer literal {lexeme!r}"
+
+    def _eval_ice(self, expr: Expr) -> int | None:
+        """Fold an integer constant expression, or return None."""
+        if isinstance(expr, IntLiteral):
+            try:
+                return self._parse_int_literal_value(expr.value)
+            except ParserError:
+                return None
+        if isinstance(expr, CharConstant):
+            body = expr.value.lstrip("uUL")[1:-1]
+            if len(body) == 1:
+                return ord(body)
+            return None
+        if isinstance(expr, UnaryExpr):
+            operand = self._eval_ice(expr.operand)
+            if operand is None:
+                return None
+            if expr.op == "+":
+                return operand
+            if expr.op == "-":
+                return -operand
+            if expr.op == "~":
+                return ~operand
+            if expr.op == "!":
+                return int(not operand)
+            return None
+        if isinstance(expr, BinaryExpr):
+            left = self._eval_ice(expr.left)
+            right = self._eval_ice(expr.right)
+            if left is None or right is None:
+                return None
+            try:
+                return {
+                    "+": lambda: left + right,
+                    "-": lambda: left - right,
+                    "*": lambda: left * right,
+                    "/": lambda: left // right if right else None,
+                    "%": lambda: left % right if right else None,
+                    "<<": lambda: left << right,
+                    ">>": lambda: left >> right,
+                    "&": lambda: left & right,
+                    "|": lambda: left | right,
+                    "^": lambda: left ^ right,
+                    "==": lambda: int(left == right),
+                    "!=": lambda: int(left != right),
+                    "<": lambda: int(left < right),
+                    ">": lambda: int(left > right),
+                    "<=": lambda: int(left <= right),
+                    ">=": lambda: int(left >= right),
+                    "&&": lambda: int(bool(left) and bool(right)),
+                    "||": lambda: int(bool(left) or bool(right)),
+                }[expr.op]()
+            except KeyError:
+                return None
+        if isinstance(expr, ConditionalExpr):
+            condition = self._eval_ice(expr.condition)
+            if condition is None:
+                return None
+            if condition:
+                return self._eval_ice(expr.then_value)
+            return self._eval_ice(expr.else_value)
+        if isinstance(expr, CastExpr):
+            if expr.target_type.pointer_depth == 0 and expr.target_type.name in BASE_TYPE_SIZES:
+                return self._eval_ice(expr.operand)
+            return None
+        if isinstance(expr, SizeofExpr) and expr.target_type is not None:
+            return expr.target_type.byte_size
+        return None
+
+    def _array_size_non_ice_error(self, expr: Expr, eval_expr) -> str:
+        """Build a diagnostic explaining why an array size is not an ICE."""
+        handler = _ARRAY_SIZE_ICE_HANDLERS.get(type(expr))
+        if handler is not None:
+            return handler(expr, eval_expr)
+        return "array size is not an integer constant expression"
+
+    # ------------------------------------------------------------------
+    # Diagnostics for malformed type positions
+
+    def _unsupported_type_name_punctuator_message(self, punctuator: str) -> str:
+        if punctuator in _MISSING_BEFORE_PUNCTUATORS:
+            return f"Type name is missing before {punctuator!r}"
+        return f"Type name cannot start with {punctuator!r}: expected a type specifier"
+
+    def _unsupported_declaration_type_punctuator_message(self, punctuator: str) -> str:
+        if punctuator in _MISSING_BEFORE_PUNCTUATORS:
+            return f"Declaration type is missing before {punctuator!r}"
+        return f"Declaration cannot start with {punctuator!r}: expected a type specifier"
+
+    def _unsupported_type_message(self, token: Token) -> str:
+        if token.kind is TokenKind.EOF:
+            return "expected a type specifier, found end of input"
+        noun = _TYPE_MESSAGE_NOUNS.get(token.kind, "")
+        return f"expected a type specifier, found {noun}{token.lexeme!r}"
+
+
+# Keyword-led type specifier dispatch: one dict probe replaces the
+# comparison ladder _parse_type_spec used to walk. Keywords absent from
+# the table (storage classes, statement keywords) raise the same
+# "expected a type specifier" diagnostic as before.
+_TYPE_SPEC_HANDLERS: dict[str, Callable[..., TypeSpec]] = {
+    "_Atomic": Parser._type_spec_atomic,
+    "_Complex": Parser._type_spec_unsupported,
+    "_Imaginary": Parser._type_spec_unsupported,
+    "_Bool": Parser._type_spec_named,
+    "void": Parser._type_spec_named,
+    "float": Parser._type_spec_named,
+    "double": Parser._type_spec_named,
+    "struct": Parser._type_spec_record,
+    "union": Parser._type_spec_record,
+    "enum": Parser._type_spec_enum,
+    "char": Parser._type_spec_simple,
+    "short": Parser._type_spec_simple,
+    "int": Parser._type_spec_simple,
+    "long": Parser._type_spec_simple,
+    "signed": Parser._type_spec_simple,
+    "unsigned": Parser._type_spec_simple,
+}
+
+
+def parse(tokens: list[Token], filename: str = "<string>") -> TranslationUnit:
+    return Parser(tokens, filename=filename).parse()
@@ -0,0 +1,227 @@
+"""Nightly trial runner for the xcc frontend.
+
+Runs the configured smoke checks against the fixture corpus, parses the
+``FAIL [stage] case: message`` lines they emit, buckets recurring failures
+into "blockers", and commits the refreshed report back to the repository.
+Intended to be driven from cron; every step is safe to re-run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+REPORT_PATH = REPO_ROOT / "TRIALS.md"
+
+GIT_TIMEOUT = 120
+CHECK_TIMEOUT = 600
+
+FAILURE_LINE_RE = re.compile(
+    r"^FAIL \[(?P<stage>[^\]]+)\] (?P<case>[^:]+): (?P<message>.+)$",
+    re.MULTILINE,
+)
+
+
+@dataclass(frozen=True)
+class SmokeCheck:
+    """One trial invocation: a command plus the environment it needs."""
+
+    name: str
+    argv: tuple[str, ...]
+    extra_env: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class TrialFailure:
+    stage: str
+    case_name: str
+    message: str
+
+
+@dataclass(frozen=True)
+class BlockerBucket:
+    code: str
+    messages: tuple[str, ...]
+    cases: tuple[str, ...]
+
+    @property
+    def count(self) -> int:
+        return len(self.cases)
+
+
+@dataclass
+class _BucketAccumulator:
+    """Mutable per-code accumulator used while grouping failures."""
+
+    messages_set: set[str] = field(default_factory=set)
+    cases_set: set[str] = field(default_factory=set)
+    count: int = 0
+
+
+@dataclass
+class TrialResult:
+    check: SmokeCheck
+    returncode: int
+    output: str
+    failures: list[TrialFailure] = field(default_factory=list)
+
+
+SMOKE_CHECKS: tuple[SmokeCheck, ...] = (
+    SmokeCheck(
+        name="frontend-fixtures",
+        argv=(sys.executable, "-m", "xcc", "--frontend", "--run-fixtures"),
+        extra_env=(("PYTHONPATH", "src"),),
+    ),
+    SmokeCheck(
+        name="external-cases",
+        argv=(sys.executable, "tools/sync_clang_fixtures.py", "--check"),
+    ),
+)
+
+
+def run_smoke_check(check: SmokeCheck) -> TrialResult:
+    """Run one smoke check and capture its combined output."""
+    # env=None inherits the parent environment without a copy; only checks
+    # that actually override variables pay for building a merged dict.
+    env = {**os.environ, **dict(check.extra_env)} if check.extra_env else None
+    try:
+        completed = subprocess.run(
+            check.argv,
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=CHECK_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired as error:
+        # TimeoutExpired can carry the partial output as bytes even in
+        # text mode, so this one path keeps a decode guard.
+        partial = error.stdout
+        if isinstance(partial, bytes):
+            partial = partial.decode("utf-8", errors="replace")
+        return TrialResult(check=check, returncode=-1, output=partial or "")
+    # text=True guarantees str here; no coercion helper needed.
+    output = completed.stdout or ""
+    result = TrialResult(check=check, returncode=completed.returncode, output=output)
+    result.failures = _parse_failures(output)
+    return result
+
+
+def _parse_failures(output: str) -> list[TrialFailure]:
+    """Extract ``FAIL [stage] case: message`` records from trial output."""
+    failures: list[TrialFailure] = []
+    for match in FAILURE_LINE_RE.finditer(output):
+        failures.append(
+            TrialFailure(
+                stage=match["stage"],
+                case_name=match["case"],
+                message=" ".join(match["message"].split()),
+            )
+        )
+    return failures
+
+
+def _build_blocker_buckets(failures: list[TrialFailure]) -> list[BlockerBucket]:
+    """Group failures by stage code into blocker buckets."""
+    by_code: dict[str, _BucketAccumulator] = {}
+    for failure in failures:
+        accumulator = by_code.get(failure.stage)
+        if accumulator is None:
+            accumulator = by_code[failure.stage] = _BucketAccumulator()
+        accumulator.messages_set.add(failure.message)
+        accumulator.cases_set.add(failure.case_name)
+        accumulator.count += 1
+    buckets = [
+        BlockerBucket(
+            code=code,
+            messages=tuple(sorted(accumulator.messages_set)),
+            cases=tuple(sorted(accumulator.cases_set)),
+        )
+        for code, accumulator in by_code.items()
+    ]
+    buckets.sort(key=lambda bucket: (-bucket.count, bucket.code))
+    return buckets
+
+
+def _render_report(results: list[TrialResult], buckets: list[BlockerBucket]) -> str:
+    lines = ["# Trial report", ""]
+    for result in results:
+        status = "ok" if result.returncode == 0 else f"exit {result.returncode}"
+        lines.append(f"- `{result.check.name}`: {status}, {len(result.failures)} failure(s)")
+    lines.append("")
+    if buckets:
+        lines.append("## Blockers")
+        lines.append("")
+        for bucket in buckets:
+            lines.append(f"### [{bucket.code}] {bucket.count} case(s)")
+            lines.append("")
+            for message in bucket.messages:
+                lines.append(f"- {message}")
+            for case in bucket.cases:
+                lines.append(f"- `{case}`")
+            lines.append("")
+    else:
+        lines.append("No blockers recorded.")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _run_git(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ("git", *args),
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        timeout=GIT_TIMEOUT,
+        check=True,
+    )
+
+
+def _worktree_status_entries() -> list[str]:
+    status = _run_git("status", "--porcelain=v2", "-z")
+    return [entry for entry in status.stdout.split("\0") if entry]
+
+
+def _commit_report(message: str) -> None:
+    # One status call decides both "anything to commit?" and "is an explicit
+    # add needed?", instead of separate status/add/commit round-trips.
+    entries = _worktree_status_entries()
+    if not entries:
+        return
+    if any(entry.startswith("? ") for entry in entries):
+        _run_git("add", "-A")
+        _run_git("-c", "commit.gpgsign=false", "commit", "-m", message)
+    else:
+        # -a stages every tracked change in the same fork as the commit.
+        _run_git("-c", "commit.gpgsign=false", "commit", "-a", "-m", message)
+
+
+def main(argv: list[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        "--no-commit",
+        action="store_true",
+        help="write the report but do not commit it",
+    )
+    args = arg_parser.parse_args(argv)
+
+    results = [run_smoke_check(check) for check in SMOKE_CHECKS]
+    failures = [failure for result in results for failure in result.failures]
+    buckets = _build_blocker_buckets(failures)
+    REPORT_PATH.write_text(_render_report(results, buckets), encoding="utf-8")
+
+    if not args.no_commit:
+        _commit_report(f"Update trial report ({len(failures)} failures)")
+    return 0 if all(result.returncode == 0 for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())